@@ -3,12 +3,24 @@ Scry App - A Magic: The Gathering Card Search Application
 Uses the Scryfall API to search and display card information.
 """
 
+import tkinter as tk
 import customtkinter as ctk
-from PIL import Image, ImageTk
-import requests
-from io import BytesIO
+import io
+import queue
 import threading
-from typing import Optional, Dict, Any
+import time
+from contextlib import contextmanager
+from concurrent.futures import Future
+import sqlite3
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Dict, Any, Callable, List, NamedTuple, Tuple
+
+# requests, diskcache and Pillow are imported where they are used to speed up startup
+if TYPE_CHECKING:
+    import diskcache
+    import requests
+    from PIL import Image
 
 # Configure CustomTkinter appearance
 ctk.set_appearance_mode("dark")
@@ -21,6 +33,141 @@ HEADERS = {
     "Accept": "application/json"
 }
 
+# Maximum number of card lookups kept in the in-memory cache
+CARD_CACHE_SIZE = 128
+
+# Delay used to coalesce bursts of search requests (held Enter, double clicks)
+SEARCH_DEBOUNCE_MS = 150
+
+# Autocomplete: delay after the last keystroke, and number of queries cached
+AUTOCOMPLETE_DEBOUNCE_MS = 250
+AUTOCOMPLETE_CACHE_SIZE = 256
+
+# Decoded card images kept in memory
+IMAGE_CACHE_SIZE = 64
+
+# Persistent caches shared across runs, as name -> diskcache size limit in bytes
+CACHE_DIR = Path.home() / ".cache" / "scry-app"
+DISK_CACHE_SIZE_LIMITS = {
+    "json": 32 << 20,
+    "images": 128 << 20
+}
+# Cached card data older than this is revalidated, as prices and legalities change
+CARD_CACHE_MAX_AGE = 7 * 86400
+
+# Largest card image shown
+IMAGE_MAX_WIDTH = 320
+IMAGE_MAX_HEIGHT = 450
+
+# Static pieces of the card details layout
+_DOUBLE_LINE = "═" * 50
+_SINGLE_LINE = "─" * 50
+_COLOR_MAP = {"W": "White", "U": "Blue", "B": "Black", "R": "Red", "G": "Green"}
+# Legality formats shown, as (Scryfall key, display label) pairs
+_FORMATS = tuple(
+    (name, name.capitalize())
+    for name in ("standard", "pioneer", "modern", "legacy", "vintage", "commander")
+)
+_STATUS_SYMBOLS = {"legal": "✓", "not_legal": "✗"}
+
+
+class _StatusFormats(dict):
+    """Legality status -> (symbol, display label); unexpected statuses get a neutral symbol."""
+
+    def __missing__(self, status: str) -> Tuple[str, str]:
+        return "○", status.replace("_", " ").title()
+
+
+# Precomputed for every status Scryfall returns
+_STATUS_FORMAT = _StatusFormats(
+    (status, (_STATUS_SYMBOLS.get(status, "○"), status.replace("_", " ").title()))
+    for status in ("legal", "not_legal", "restricted", "banned", "unknown")
+)
+
+
+class _CachedCard(NamedTuple):
+    """Card data with the validators needed to revalidate it via a conditional request."""
+
+    card_data: Dict[str, Any]
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fetched_at: float
+
+
+def _disk_cache_errors() -> tuple:
+    """Return the exceptions a persistent cache read or write can raise."""
+    import diskcache
+    return (OSError, sqlite3.Error, diskcache.Timeout)
+
+
+@contextmanager
+def _editable(textbox: ctk.CTkTextbox):
+    """Temporarily enable a read-only textbox so its contents can be replaced."""
+    textbox.configure(state="normal")
+    try:
+        yield textbox
+    finally:
+        textbox.configure(state="disabled")
+
+
+class _WorkerPool:
+    """Fixed set of daemon worker threads running submitted calls in order.
+
+    Works like a small ThreadPoolExecutor, but its threads are daemons so a request
+    still in flight can't keep the process alive after the window closes, and
+    shutdown() cancels queued calls on every supported Python version.
+    """
+
+    def __init__(self, max_workers: int, thread_name_prefix: str):
+        self._queue: "queue.Queue[Optional[Tuple[Future, Callable, tuple]]]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._shutdown = False
+        self._max_workers = max_workers
+        for i in range(max_workers):
+            threading.Thread(
+                target=self._work, name=f"{thread_name_prefix}_{i}", daemon=True
+            ).start()
+
+    def submit(self, fn: Callable, *args) -> Future:
+        """Queue `fn(*args)` and return a Future for its result."""
+        future: Future = Future()
+        with self._lock:
+            if self._shutdown:
+                future.cancel()
+            else:
+                self._queue.put((future, fn, args))
+        return future
+
+    def shutdown(self):
+        """Cancel queued calls and let the workers exit after their current call."""
+        with self._lock:
+            self._shutdown = True
+            while True:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is not None:
+                    item[0].cancel()
+            for _ in range(self._max_workers):
+                self._queue.put(None)
+
+    def _work(self):
+        """Run queued calls until a shutdown sentinel arrives."""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            future, fn, args = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = fn(*args)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+
 
 class ScryApp(ctk.CTk):
     """Main application window for the Scryfall card search app."""
@@ -37,17 +184,129 @@ class ScryApp(ctk.CTk):
         self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(1, weight=1)
 
-        # Store current card image reference
-        self.current_image: Optional[ImageTk.PhotoImage] = None
+        # Shared HTTP session so API and image requests reuse pooled connections;
+        # created on first use so importing requests doesn't delay the first paint
+        self._session: Optional["requests.Session"] = None
+        self._session_lock = threading.Lock()
+
+        # Persistent card and image caches, opened on first use (None if unavailable)
+        self._disk_caches: Dict[str, Optional["diskcache.Cache"]] = {}
+        self._disk_cache_lock = threading.Lock()
+
+        # Shared worker pool for searches and image downloads
+        self._pool = _WorkerPool(max_workers=2, thread_name_prefix="scry")
+        self._current_future: Optional[Future] = None
+        self._closed = False
+
+        # Generation tokens; results from superseded requests are discarded
+        self._search_gen = 0
+        self._image_gen = 0
+        self._autocomplete_gen = 0
+
+        # Pending debounced search and autocomplete, if any
+        self._pending_after_id: Optional[str] = None
+        self._autocomplete_after_id: Optional[str] = None
+        self._autocomplete_future: Optional[Future] = None
+
+        # Card image shown in the label; created once and reconfigured per card
+        self.current_image: Optional[ctk.CTkImage] = None
         self.current_card_data: Optional[Dict[str, Any]] = None
 
+        # LRU cache of card JSON and its validators keyed by normalized search query
+        self._card_cache: "OrderedDict[str, _CachedCard]" = OrderedDict()
+        self._card_cache_lock = threading.Lock()
+
+        # LRU cache of decoded, resized card images keyed by image URL
+        self._img_mem: "OrderedDict[str, Image.Image]" = OrderedDict()
+        self._img_mem_cap = IMAGE_CACHE_SIZE
+        self._img_mem_lock = threading.Lock()
+
+        # LRU cache of autocomplete suggestions keyed by normalized query
+        self._autocomplete_cache: "OrderedDict[str, List[str]]" = OrderedDict()
+        self._autocomplete_lock = threading.Lock()
+
         # Create UI components
         self._create_header()
         self._create_main_content()
         self._create_status_bar()
 
         # Bind Enter key to search
-        self.bind("<Return>", lambda e: self._perform_search())
+        self.bind("<Return>", lambda e: self._schedule_search())
+        # Shift+Enter bypasses the cache and refreshes from Scryfall
+        self.bind("<Shift-Return>", lambda e: self._schedule_search(refresh=True))
+
+        # Release pooled connections when the window is closed
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+
+        # Warm up the network stack once the window is up
+        self.after_idle(lambda: self._pool.submit(self._preload))
+
+    @property
+    def session(self) -> "requests.Session":
+        """Return the shared HTTP session, creating it on first use."""
+        with self._session_lock:
+            if self._session is None:
+                self._session = self._create_session()
+            return self._session
+
+    def _get_disk_cache(self, name: str) -> Optional["diskcache.Cache"]:
+        """Return the named persistent cache, opening it on first use."""
+        with self._disk_cache_lock:
+            if name not in self._disk_caches:
+                try:
+                    import diskcache
+                    self._disk_caches[name] = diskcache.Cache(
+                        str(CACHE_DIR / name),
+                        size_limit=DISK_CACHE_SIZE_LIMITS[name],
+                        eviction_policy="least-recently-used"
+                    )
+                except (ImportError, OSError, sqlite3.Error):
+                    # Run without persistence rather than failing searches
+                    self._disk_caches[name] = None
+            return self._disk_caches[name]
+
+    def _preload(self):
+        """Create the session and open caches in the background so the first search is fast."""
+        # Creating the session imports requests and urllib3
+        _ = self.session
+        for name in DISK_CACHE_SIZE_LIMITS:
+            self._get_disk_cache(name)
+
+    def _create_session(self) -> "requests.Session":
+        """Create an HTTP session with keep-alive pooling and retries."""
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        session = requests.Session()
+        retry = Retry(
+            total=2,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            # Hand the final response back so callers can report its status code
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry)
+        session.mount("https://", adapter)
+        # requests already sends Accept-Encoding for every codec it can decode
+        session.headers.update(HEADERS)
+        return session
+
+    def _on_close(self):
+        """Stop background work, close the HTTP session and caches, and destroy the window."""
+        self._closed = True
+        if self._pending_after_id is not None:
+            self.after_cancel(self._pending_after_id)
+        if self._autocomplete_after_id is not None:
+            self.after_cancel(self._autocomplete_after_id)
+        self._pool.shutdown()
+        if self._session is not None:
+            self._session.close()
+        with self._disk_cache_lock:
+            for cache in self._disk_caches.values():
+                if cache is not None:
+                    cache.close()
+        self.destroy()
 
     def _create_header(self):
         """Create the header section with search controls."""
@@ -79,6 +338,7 @@ class ScryApp(ctk.CTk):
             height=40
         )
         self.search_entry.grid(row=1, column=1, padx=(0, 10), sticky="ew")
+        self.search_entry.bind("<KeyRelease>", lambda e: self._schedule_autocomplete())
 
         # Search button
         self.search_button = ctk.CTkButton(
@@ -87,10 +347,20 @@ class ScryApp(ctk.CTk):
             font=ctk.CTkFont(size=14, weight="bold"),
             height=40,
             width=100,
-            command=self._perform_search
+            command=self._schedule_search
         )
         self.search_button.grid(row=1, column=2)
 
+        # Top autocomplete match for the current entry text
+        self.suggestion_label = ctk.CTkLabel(
+            header_frame,
+            text="",
+            font=ctk.CTkFont(size=12),
+            text_color="#888888",
+            height=20
+        )
+        self.suggestion_label.grid(row=2, column=1, padx=(5, 10), sticky="w")
+
     def _create_main_content(self):
         """Create the main content area with card display."""
         content_frame = ctk.CTkFrame(self)
@@ -133,64 +403,260 @@ class ScryApp(ctk.CTk):
 
     def _create_status_bar(self):
         """Create the status bar at the bottom."""
+        # Text goes through a StringVar so updates don't reconfigure the label
+        self._status_var = tk.StringVar(self, value="Ready - Enter a card name to search")
+        self._status_color = "#888888"
         self.status_label = ctk.CTkLabel(
             self,
-            text="Ready - Enter a card name to search",
+            textvariable=self._status_var,
             font=ctk.CTkFont(size=12),
-            text_color="#888888"
+            text_color=self._status_color
         )
         self.status_label.grid(row=2, column=0, padx=20, pady=(5, 10), sticky="w")
 
     def _set_status(self, message: str, is_error: bool = False):
         """Update the status bar message."""
         color = "#ff6b6b" if is_error else "#888888"
-        self.status_label.configure(text=message, text_color=color)
+        self._status_var.set(message)
+        if color != self._status_color:
+            self._status_color = color
+            self.status_label.configure(text_color=color)
+
+    def _get_cached_card(self, key: str) -> Optional[_CachedCard]:
+        """Return the cached card for a normalized query, checking memory then disk."""
+        with self._card_cache_lock:
+            entry = self._card_cache.get(key)
+            if entry is not None:
+                self._card_cache.move_to_end(key)
+                return entry
+
+        json_cache = self._get_disk_cache("json")
+        if json_cache is None:
+            return None
+        try:
+            value = json_cache.get(key)
+        except _disk_cache_errors():
+            # Treat an unreadable or locked cache as a miss and go to the network
+            return None
+        # Stored as a plain tuple so entries don't depend on how this module was imported
+        if not isinstance(value, tuple) or len(value) != len(_CachedCard._fields):
+            return None
+        entry = _CachedCard(*value)
+        self._cache_card(key, entry, persist=False)
+        return entry
+
+    def _cache_card(self, key: str, entry: _CachedCard, persist: bool = True):
+        """Store a card in the LRU cache, evicting the oldest entry if full."""
+        with self._card_cache_lock:
+            self._card_cache[key] = entry
+            self._card_cache.move_to_end(key)
+            if len(self._card_cache) > CARD_CACHE_SIZE:
+                self._card_cache.popitem(last=False)
+
+        json_cache = self._get_disk_cache("json") if persist else None
+        if json_cache is not None:
+            try:
+                json_cache.set(key, tuple(entry))
+            except _disk_cache_errors():
+                # Persisting is best-effort; the card is still cached in memory
+                pass
+
+    def _post_if_current(self, gen_attr: str, gen: int, callback: Callable, *args, **kwargs):
+        """Schedule a UI callback that only runs if `gen` is still the latest generation."""
+        def apply():
+            if getattr(self, gen_attr) == gen:
+                callback(*args, **kwargs)
+        # Work finishing after the window closed has nowhere to report to
+        if not self._closed:
+            self.after(0, apply)
+
+    def _get_cached_suggestions(self, key: str) -> Optional[List[str]]:
+        """Return cached autocomplete suggestions for a normalized query, if present."""
+        with self._autocomplete_lock:
+            suggestions = self._autocomplete_cache.get(key)
+            if suggestions is not None:
+                self._autocomplete_cache.move_to_end(key)
+            return suggestions
+
+    def _cache_suggestions(self, key: str, suggestions: List[str]):
+        """Store autocomplete suggestions, evicting the oldest entry if full."""
+        with self._autocomplete_lock:
+            self._autocomplete_cache[key] = suggestions
+            self._autocomplete_cache.move_to_end(key)
+            if len(self._autocomplete_cache) > AUTOCOMPLETE_CACHE_SIZE:
+                self._autocomplete_cache.popitem(last=False)
+
+    def _schedule_autocomplete(self):
+        """Look up suggestions once typing pauses, restarting the delay on each key."""
+        if self._autocomplete_after_id is not None:
+            self.after_cancel(self._autocomplete_after_id)
+        self._autocomplete_after_id = self.after(
+            AUTOCOMPLETE_DEBOUNCE_MS, self._start_autocomplete
+        )
+
+    def _start_autocomplete(self):
+        """Show suggestions for the entry text, fetching them if not cached."""
+        self._autocomplete_after_id = None
+        self._autocomplete_gen += 1
+
+        query = self.search_entry.get().strip()
+        # Scryfall returns no suggestions for queries shorter than 2 characters
+        if len(query) < 2:
+            self._show_suggestions(None)
+            return
+
+        suggestions = self._get_cached_suggestions(query.lower())
+        if suggestions is not None:
+            self._show_suggestions(suggestions)
+            return
+
+        # The previous query's suggestion no longer applies while this one is looked up
+        self._show_suggestions(None)
+
+        # Only the newest lookup matters; don't let older ones hold up searches
+        if self._autocomplete_future is not None:
+            self._autocomplete_future.cancel()
+        self._autocomplete_future = self._pool.submit(
+            self._fetch_autocomplete, query, self._autocomplete_gen
+        )
+
+    def _fetch_autocomplete(self, query: str, gen: int):
+        """Fetch autocomplete suggestions for a query from the Scryfall API."""
+        if gen != self._autocomplete_gen:
+            return
+
+        try:
+            url = f"{SCRYFALL_API_BASE}/cards/autocomplete"
+            response = self.session.get(url, params={"q": query}, timeout=5)
+            if response.status_code != 200:
+                self._post_if_current("_autocomplete_gen", gen, self._show_suggestions, None)
+                return
+            suggestions = response.json().get("data", [])
+        except Exception:
+            # Suggestions are best-effort; a normal search still works without them
+            self._post_if_current("_autocomplete_gen", gen, self._show_suggestions, None)
+            return
+
+        self._cache_suggestions(query.lower(), suggestions)
+        self._post_if_current("_autocomplete_gen", gen, self._show_suggestions, suggestions)
+
+    def _show_suggestions(self, suggestions: Optional[List[str]]):
+        """Display the top autocomplete match below the search entry."""
+        if suggestions is None:
+            text = ""
+        elif suggestions:
+            text = f"→ {suggestions[0]}"
+        else:
+            text = "No matching card names"
+        self.suggestion_label.configure(text=text)
+
+    def _schedule_search(self, refresh: bool = False):
+        """Run a search after a short delay, restarting the delay on each call."""
+        if self._pending_after_id is not None:
+            self.after_cancel(self._pending_after_id)
+        self._pending_after_id = self.after(
+            SEARCH_DEBOUNCE_MS, lambda: self._perform_search(refresh)
+        )
+
+    def _perform_search(self, refresh: bool = False):
+        """Initiate the card search on the background worker pool."""
+        self._pending_after_id = None
 
-    def _perform_search(self):
-        """Initiate the card search in a background thread."""
         card_name = self.search_entry.get().strip()
         if not card_name:
             self._set_status("Please enter a card name", is_error=True)
             return
 
+        # Use an exact lookup when autocomplete resolved the query unambiguously:
+        # the query is a card name, or matches only one card
+        exact = False
+        suggestions = self._get_cached_suggestions(card_name.lower())
+        if suggestions:
+            for suggestion in suggestions:
+                if suggestion.lower() == card_name.lower():
+                    card_name, exact = suggestion, True
+                    break
+            else:
+                if len(suggestions) == 1:
+                    card_name, exact = suggestions[0], True
+
         # Disable search button and update status
         self.search_button.configure(state="disabled")
         self._set_status(f"Searching for '{card_name}'...")
 
-        # Run search in background thread
-        thread = threading.Thread(target=self._search_card, args=(card_name,))
-        thread.daemon = True
-        thread.start()
+        # Drop any search still waiting in the queue; only the latest matters
+        if self._current_future is not None:
+            self._current_future.cancel()
+
+        # Run search on the background worker pool
+        self._search_gen += 1
+        self._current_future = self._pool.submit(
+            self._search_card, card_name, self._search_gen, refresh, exact
+        )
 
-    def _search_card(self, card_name: str):
+    def _search_card(self, card_name: str, gen: int, refresh: bool = False, exact: bool = False):
         """Search for a card using the Scryfall API."""
-        try:
-            # Use fuzzy search for flexible matching
-            url = f"{SCRYFALL_API_BASE}/cards/named"
-            params = {"fuzzy": card_name}
+        import requests
 
-            response = requests.get(url, params=params, headers=HEADERS, timeout=10)
+        def post(callback: Callable, *args):
+            self._post_if_current("_search_gen", gen, callback, *args)
 
-            if response.status_code == 200:
+        key = card_name.strip().lower()
+        try:
+            cached = self._get_cached_card(key)
+            if (
+                cached is not None
+                and not refresh
+                and time.time() - cached.fetched_at < CARD_CACHE_MAX_AGE
+            ):
+                post(self._apply_card, cached.card_data, self._format_card_details(cached.card_data))
+                return
+
+            # Use exact lookup for autocompleted names, fuzzy search for flexible matching
+            url = f"{SCRYFALL_API_BASE}/cards/named"
+            params = {"exact": card_name} if exact else {"fuzzy": card_name}
+
+            # Revalidate a stale or refreshed card instead of re-downloading it
+            headers = {}
+            if cached is not None:
+                if cached.etag:
+                    headers["If-None-Match"] = cached.etag
+                if cached.last_modified:
+                    headers["If-Modified-Since"] = cached.last_modified
+
+            response = self.session.get(url, params=params, headers=headers, timeout=10)
+
+            if response.status_code == 304 and cached is not None:
+                card_data = cached.card_data
+                self._cache_card(key, cached._replace(fetched_at=time.time()))
+                post(self._apply_card, card_data, self._format_card_details(card_data))
+            elif response.status_code == 200:
                 card_data = response.json()
-                self.current_card_data = card_data
-                self.after(0, lambda: self._display_card(card_data))
+                self._cache_card(key, _CachedCard(
+                    card_data,
+                    response.headers.get("ETag"),
+                    response.headers.get("Last-Modified"),
+                    time.time()
+                ))
+                post(self._apply_card, card_data, self._format_card_details(card_data))
             elif response.status_code == 404:
                 error_data = response.json()
                 error_msg = error_data.get("details", "Card not found")
-                self.after(0, lambda: self._show_error(error_msg))
+                post(self._show_error, error_msg)
             else:
-                self.after(0, lambda: self._show_error(f"API error: {response.status_code}"))
+                post(self._show_error, f"API error: {response.status_code}")
 
         except requests.exceptions.Timeout:
-            self.after(0, lambda: self._show_error("Request timed out. Please try again."))
+            post(self._show_error, "Request timed out. Please try again.")
         except requests.exceptions.ConnectionError:
-            self.after(0, lambda: self._show_error("Connection error. Check your internet connection."))
+            post(self._show_error, "Connection error. Check your internet connection.")
         except Exception as e:
-            self.after(0, lambda: self._show_error(f"Error: {str(e)}"))
+            post(self._show_error, f"Error: {str(e)}")
 
-    def _display_card(self, card_data: Dict[str, Any]):
+    def _apply_card(self, card_data: Dict[str, Any], details: str):
         """Display the card information and image."""
+        self.current_card_data = card_data
+
         # Re-enable search button
         self.search_button.configure(state="normal")
 
@@ -198,111 +664,105 @@ class ScryApp(ctk.CTk):
         self._set_status(f"Found: {card_data.get('name', 'Unknown')}")
 
         # Display card details
-        self._display_card_details(card_data)
+        with _editable(self.details_textbox) as textbox:
+            textbox.delete("1.0", "end")
+            textbox.insert("1.0", details)
 
-        # Load and display card image
+        # Show the image placeholder and start loading the card image
         self._load_card_image(card_data)
 
-    def _display_card_details(self, card_data: Dict[str, Any]):
-        """Format and display card details in the text box."""
-        details = []
+    @staticmethod
+    def _format_card_details(card_data: Dict[str, Any]) -> str:
+        """Format card details as display text. Safe to call from any thread."""
+        buf = io.StringIO()
 
         # Card name and mana cost
         name = card_data.get("name", "Unknown")
         mana_cost = card_data.get("mana_cost", "")
-        details.append(f"{'═' * 50}")
-        details.append(f"  {name}  {mana_cost}")
-        details.append(f"{'═' * 50}\n")
+        buf.write(f"{_DOUBLE_LINE}\n  {name}  {mana_cost}\n{_DOUBLE_LINE}\n")
 
         # Type line
         type_line = card_data.get("type_line", "")
         if type_line:
-            details.append(f"Type: {type_line}\n")
+            buf.write(f"\nType: {type_line}\n")
 
         # Mana value (CMC)
         cmc = card_data.get("cmc", 0)
-        details.append(f"Mana Value: {int(cmc)}\n")
+        buf.write(f"\nMana Value: {int(cmc)}\n")
 
         # Colors
         colors = card_data.get("colors", [])
-        color_map = {"W": "White", "U": "Blue", "B": "Black", "R": "Red", "G": "Green"}
         if colors:
-            color_names = [color_map.get(c, c) for c in colors]
-            details.append(f"Colors: {', '.join(color_names)}\n")
+            color_names = [_COLOR_MAP.get(c, c) for c in colors]
+            buf.write(f"\nColors: {', '.join(color_names)}\n")
         else:
-            details.append("Colors: Colorless\n")
+            buf.write("\nColors: Colorless\n")
 
         # Oracle text
         oracle_text = card_data.get("oracle_text", "")
         if oracle_text:
-            details.append(f"{'─' * 50}")
-            details.append(f"\nOracle Text:\n{oracle_text}\n")
+            buf.write(f"\n{_SINGLE_LINE}\n\nOracle Text:\n{oracle_text}\n")
 
         # Flavor text
         flavor_text = card_data.get("flavor_text", "")
         if flavor_text:
-            details.append(f"\n{'─' * 50}")
-            details.append(f"\nFlavor Text:\n\"{flavor_text}\"\n")
+            buf.write(f"\n\n{_SINGLE_LINE}\n\nFlavor Text:\n\"{flavor_text}\"\n")
 
         # Power/Toughness for creatures
         power = card_data.get("power")
         toughness = card_data.get("toughness")
         if power and toughness:
-            details.append(f"\nPower/Toughness: {power}/{toughness}")
+            buf.write(f"\n\nPower/Toughness: {power}/{toughness}")
 
         # Loyalty for planeswalkers
         loyalty = card_data.get("loyalty")
         if loyalty:
-            details.append(f"\nStarting Loyalty: {loyalty}")
+            buf.write(f"\n\nStarting Loyalty: {loyalty}")
 
         # Rarity and set
-        details.append(f"\n{'─' * 50}\n")
         rarity = card_data.get("rarity", "").capitalize()
         set_name = card_data.get("set_name", "Unknown Set")
-        details.append(f"Rarity: {rarity}")
-        details.append(f"Set: {set_name}")
+        buf.write(f"\n\n{_SINGLE_LINE}\n\nRarity: {rarity}\nSet: {set_name}")
 
         # Prices
         prices = card_data.get("prices", {})
         usd_price = prices.get("usd")
         usd_foil = prices.get("usd_foil")
         if usd_price or usd_foil:
-            details.append(f"\n{'─' * 50}")
-            details.append("\nPrices:")
+            buf.write(f"\n\n{_SINGLE_LINE}\n\nPrices:")
             if usd_price:
-                details.append(f"  Regular: ${usd_price}")
+                buf.write(f"\n  Regular: ${usd_price}")
             if usd_foil:
-                details.append(f"  Foil: ${usd_foil}")
+                buf.write(f"\n  Foil: ${usd_foil}")
 
         # Legalities
         legalities = card_data.get("legalities", {})
         if legalities:
-            details.append(f"\n{'─' * 50}")
-            details.append("\nFormat Legality:")
-            for format_name in ["standard", "pioneer", "modern", "legacy", "vintage", "commander"]:
-                status = legalities.get(format_name, "unknown")
-                status_symbol = "✓" if status == "legal" else "✗" if status == "not_legal" else "○"
-                details.append(f"  {status_symbol} {format_name.capitalize()}: {status.replace('_', ' ').title()}")
+            statuses = [_STATUS_FORMAT[legalities.get(format_name, "unknown")] for format_name, _ in _FORMATS]
+            lines = [
+                f"  {symbol} {format_label}: {label}"
+                for (_, format_label), (symbol, label) in zip(_FORMATS, statuses)
+            ]
+            buf.write(f"\n\n{_SINGLE_LINE}\n\nFormat Legality:\n")
+            buf.write("\n".join(lines))
 
         # Artist
         artist = card_data.get("artist", "")
         if artist:
-            details.append(f"\n{'─' * 50}")
-            details.append(f"\nArtist: {artist}")
+            buf.write(f"\n\n{_SINGLE_LINE}\n\nArtist: {artist}")
 
         # Scryfall URI
         scryfall_uri = card_data.get("scryfall_uri", "")
         if scryfall_uri:
-            details.append(f"\nScryfall: {scryfall_uri}")
+            buf.write(f"\n\nScryfall: {scryfall_uri}")
 
-        # Update textbox
-        self.details_textbox.configure(state="normal")
-        self.details_textbox.delete("1.0", "end")
-        self.details_textbox.insert("1.0", "\n".join(details))
-        self.details_textbox.configure(state="disabled")
+        return buf.getvalue()
 
     def _load_card_image(self, card_data: Dict[str, Any]):
         """Load and display the card image."""
+        # Invalidate any image load still in flight for a previous card
+        self._image_gen += 1
+
         # Get image URL - handle different card layouts
         image_uris = card_data.get("image_uris")
 
@@ -312,54 +772,139 @@ class ScryApp(ctk.CTk):
             if faces and "image_uris" in faces[0]:
                 image_uris = faces[0]["image_uris"]
 
-        if not image_uris:
-            self.card_image_label.configure(image=None, text="No image available")
-            return
-
-        # Use 'normal' size for good quality without being too large
-        image_url = image_uris.get("normal") or image_uris.get("large") or image_uris.get("small")
+        # Use 'normal' size: the smallest variant that still covers the display area
+        image_url = None
+        if image_uris:
+            image_url = image_uris.get("normal") or image_uris.get("large") or image_uris.get("small")
 
         if not image_url:
             self.card_image_label.configure(image=None, text="No image available")
             return
 
-        # Load image in background
-        thread = threading.Thread(target=self._fetch_and_display_image, args=(image_url,))
-        thread.daemon = True
-        thread.start()
+        # Load image on the background worker pool
+        self.card_image_label.configure(image=None, text="Loading image…")
+        self._pool.submit(self._fetch_and_display_image, image_url, self._image_gen)
 
-    def _fetch_and_display_image(self, image_url: str):
+    def _fetch_and_display_image(self, image_url: str, gen: int):
         """Fetch image from URL and display it."""
+        # A newer card was displayed while this load was queued
+        if gen != self._image_gen:
+            return
+
         try:
-            response = requests.get(image_url, headers=HEADERS, timeout=15)
-            if response.status_code == 200:
-                image_data = BytesIO(response.content)
-                pil_image = Image.open(image_data)
-
-                # Resize to fit the display area while maintaining aspect ratio
-                max_height = 450
-                max_width = 320
-                pil_image.thumbnail((max_width, max_height), Image.Resampling.LANCZOS)
-
-                # Convert to CTkImage for display
-                ctk_image = ctk.CTkImage(
-                    light_image=pil_image,
-                    dark_image=pil_image,
-                    size=pil_image.size
-                )
-
-                # Update in main thread
-                self.after(0, lambda: self._set_card_image(ctk_image))
+            with self._img_mem_lock:
+                pil_image = self._img_mem.get(image_url)
+                if pil_image is not None:
+                    self._img_mem.move_to_end(image_url)
+
+            if pil_image is None:
+                pil_image = self._read_card_image(image_url)
+                if pil_image is None:
+                    self._post_if_current(
+                        "_image_gen", gen, self.card_image_label.configure,
+                        image=None, text="No image available"
+                    )
+                    return
+
+                with self._img_mem_lock:
+                    self._img_mem[image_url] = pil_image
+                    if len(self._img_mem) > self._img_mem_cap:
+                        self._img_mem.popitem(last=False)
+
+            # Update in main thread
+            self._post_if_current("_image_gen", gen, self._set_card_image, pil_image)
         except Exception as e:
-            self.after(0, lambda: self.card_image_label.configure(
-                image=None,
-                text=f"Failed to load image:\n{str(e)}"
-            ))
+            self._post_if_current(
+                "_image_gen", gen, self.card_image_label.configure,
+                image=None, text=f"Failed to load image:\n{str(e)}"
+            )
+
+    def _read_card_image(self, image_url: str) -> Optional["Image.Image"]:
+        """Return the resized card image from the disk cache, downloading on a miss."""
+        image_cache = self._get_disk_cache("images")
+        if image_cache is not None:
+            pil_image = self._read_cached_image(image_cache, image_url)
+            if pil_image is not None:
+                return pil_image
+
+        with self.session.get(image_url, timeout=15, stream=True) as response:
+            if response.status_code != 200:
+                return None
+            response.raw.decode_content = True
+
+            if image_cache is None:
+                # Cache unavailable; decode directly from the response. The image is
+                # fully loaded here, before the response is closed and its socket
+                # returned to the pool.
+                pil_image = self._decode_card_image(response.raw)
+                return pil_image
+            image_data = response.raw.read()
+
+        # Persisting is best-effort; always decode from the downloaded bytes
+        try:
+            image_cache.set(image_url, io.BytesIO(image_data), read=True)
+        except _disk_cache_errors():
+            pass
+        return self._decode_card_image(io.BytesIO(image_data))
+
+    def _read_cached_image(self, image_cache: "diskcache.Cache", image_url: str) -> Optional["Image.Image"]:
+        """Return the resized card image from the disk cache, or None on a miss or cache error."""
+        try:
+            handle = image_cache.get(image_url, read=True)
+        except _disk_cache_errors():
+            return None
+        if handle is None:
+            return None
 
-    def _set_card_image(self, image: ctk.CTkImage):
+        try:
+            with handle:
+                return self._decode_card_image(handle)
+        except OSError:
+            # Corrupt cache entry; drop it so it is downloaded again
+            try:
+                image_cache.delete(image_url)
+            except _disk_cache_errors():
+                pass
+            return None
+
+    @staticmethod
+    def _decode_card_image(source) -> "Image.Image":
+        """Decode an image file or stream, resized to fit the display area."""
+        from PIL import Image
+
+        pil_image = Image.open(source)
+
+        # Let the JPEG decoder downscale while decoding (no-op for other formats)
+        pil_image.draft("RGB", (IMAGE_MAX_WIDTH, IMAGE_MAX_HEIGHT))
+
+        # Resize to fit the display area while maintaining aspect ratio
+        pil_image.thumbnail((IMAGE_MAX_WIDTH, IMAGE_MAX_HEIGHT), Image.Resampling.BILINEAR)
+
+        # thumbnail() skips loading images that already fit; decode now, while the source is open
+        pil_image.load()
+        return pil_image
+
+    def _set_card_image(self, pil_image: "Image.Image"):
         """Set the card image in the UI."""
-        self.current_image = image
-        self.card_image_label.configure(image=image, text="")
+        # Swap the picture inside the existing CTkImage rather than building a new one
+        if self.current_image is None:
+            self.current_image = ctk.CTkImage(
+                light_image=pil_image,
+                dark_image=pil_image,
+                size=pil_image.size
+            )
+        else:
+            self.current_image.configure(
+                light_image=pil_image,
+                dark_image=pil_image,
+                size=pil_image.size
+            )
+
+        # Reattach the image only if the label was showing a placeholder
+        if self.card_image_label.cget("image") is not self.current_image:
+            self.card_image_label.configure(image=self.current_image, text="")
+        else:
+            self.card_image_label.configure(text="")
 
     def _show_error(self, message: str):
         """Display an error message."""
@@ -367,12 +912,12 @@ class ScryApp(ctk.CTk):
         self._set_status(message, is_error=True)
 
         # Update details textbox with error
-        self.details_textbox.configure(state="normal")
-        self.details_textbox.delete("1.0", "end")
-        self.details_textbox.insert("1.0", f"Error: {message}\n\nPlease try another search.")
-        self.details_textbox.configure(state="disabled")
+        with _editable(self.details_textbox) as textbox:
+            textbox.delete("1.0", "end")
+            textbox.insert("1.0", f"Error: {message}\n\nPlease try another search.")
 
-        # Clear the image
+        # Clear the image and drop any image load still in flight
+        self._image_gen += 1
         self.card_image_label.configure(image=None, text="No card to display")
 
 